@@ -1,5 +1,261 @@
 import numpy as np
+import pandas as pd
 import matplotlib.pyplot as plt
+from numba import njit, prange, types
+
+
+def _simulate_signature(float_type):
+    """Numba signature of _simulate for float64 or float32 input and result arrays."""
+    # Inputs are declared read-only since pandas may hand out read-only views
+    readonly_1d = types.Array(float_type, 1, "A", readonly=True)
+    return types.Tuple(
+        (
+            float_type[:],
+            float_type[:],
+            float_type[:],
+            types.int8[:],
+            types.int8[:],
+            float_type[:],
+        )
+    )(
+        readonly_1d,
+        readonly_1d,
+        readonly_1d,
+        types.int64,
+        types.int64,
+        types.int64,
+        types.float64,
+        types.float64,
+        types.boolean,
+        types.int64,
+        types.float64,
+        types.float64,
+    )
+
+
+# Explicit signatures so _simulate is compiled once at import and then loaded
+# from Numba's on-disk cache, whatever scalar types the caller passes in
+@njit(
+    [_simulate_signature(types.float64), _simulate_signature(types.float32)],
+    cache=True,
+)
+def _simulate(
+    forecast,
+    demand,
+    error,
+    last_actual,
+    lead_time,
+    review_period,
+    base_ss,
+    initial_inv,
+    use_rolling_ss,
+    rolling_window,
+    safety_factor,
+    time_factor,
+):
+    """
+    Compiled period loop of forecast_periodic_review_inventory.
+
+    Periods up to and including last_actual consume actual demand; later
+    periods consume the forecast. error is forecast - demand and feeds the
+    rolling safety stock update. Returns the order quantity, on-hand
+    inventory, safety stock target, below-safety-stock flag, stockout flag
+    and ending inventory arrays, in the floating point type of forecast.
+    Running totals are kept in float64 either way.
+    """
+    n_periods = len(forecast)
+
+    # Mark review points once instead of testing t % review_period each period
+    is_review = np.zeros(n_periods, dtype=np.bool_)
+    is_review[::review_period] = True
+
+    # Preallocate result arrays
+    order_q = np.zeros(n_periods, dtype=forecast.dtype)
+    on_hand = np.zeros(n_periods, dtype=forecast.dtype)
+    ss_target = np.full(n_periods, base_ss, dtype=forecast.dtype)
+    below_ss = np.zeros(n_periods, dtype=np.int8)
+    stockout = np.zeros(n_periods, dtype=np.int8)
+    ending_inv = np.zeros(n_periods, dtype=forecast.dtype)
+
+    # Initialize tracking variables
+    current_ss_target = base_ss
+    on_hand_inventory = initial_inv
+    # Orders in transit are kept in a ring buffer indexed by t % lead_time,
+    # with a running total so the inventory position needs no rescan
+    in_transit_ring = np.zeros(lead_time)
+    in_transit_sum = 0.0
+
+    for t in range(n_periods):
+        # Update safety stock target if rolling option is enabled (only for historical periods)
+        if (
+            use_rolling_ss
+            and t >= rolling_window
+            and t % rolling_window == 0
+            and t <= last_actual
+        ):
+            recent_errors = error[max(0, t - rolling_window) : t]
+            if not np.isnan(recent_errors).all():
+                std_error_rolling = np.nanstd(recent_errors)
+                current_ss_target = safety_factor * std_error_rolling * time_factor
+                ss_target[t:] = current_ss_target
+
+        # Receive any arriving order
+        slot = t % lead_time
+        arriving_order = in_transit_ring[slot]
+        in_transit_ring[slot] = 0.0
+        in_transit_sum -= arriving_order
+        on_hand_inventory += arriving_order
+
+        # Record inventory before demand
+        on_hand[t] = on_hand_inventory
+
+        # Place order if at review period
+        if is_review[t]:
+            # Calculate inventory position (on-hand + in-transit)
+            inventory_position = on_hand_inventory + in_transit_sum
+
+            # Calculate expected demand during lead time + review period
+            future_periods = min(lead_time + review_period, n_periods - t)
+            # Summed directly over the short window, skipping missing forecasts
+            future_demand = 0.0
+            for i in range(t, t + future_periods):
+                if not np.isnan(forecast[i]):
+                    future_demand += forecast[i]
+
+            # Calculate order-up-to level (expected demand + safety stock)
+            order_up_to_level = future_demand + current_ss_target
+
+            # Place order to reach target level
+            order_qty = max(0.0, order_up_to_level - inventory_position)
+            order_q[t] = order_qty
+            in_transit_ring[slot] = order_qty
+            in_transit_sum += order_qty
+
+        # Use actual demand if available, otherwise use forecast for projections
+        if t <= last_actual:
+            period_demand = demand[t]
+        else:
+            period_demand = forecast[t]
+
+        # Fulfill demand
+        if period_demand <= on_hand_inventory:
+            on_hand_inventory -= period_demand
+        else:
+            # Stockout occurs
+            on_hand_inventory = 0.0
+            stockout[t] = 1
+
+        # Check if we're below safety stock target
+        if on_hand_inventory < current_ss_target:
+            below_ss[t] = 1
+
+        # Record results
+        ending_inv[t] = on_hand_inventory
+
+    return order_q, on_hand, ss_target, below_ss, stockout, ending_inv
+
+
+@njit(parallel=True, cache=True)
+def _simulate_batch(
+    forecast,
+    demand,
+    error,
+    last_actual,
+    lead_time,
+    review_period,
+    base_ss,
+    initial_inv,
+    use_rolling_ss,
+    rolling_window,
+    safety_factor,
+    time_factor,
+):
+    """
+    Runs _simulate for every row (SKU) of 2-D forecast/demand/error arrays in
+    parallel. last_actual, base_ss and initial_inv hold one value per SKU.
+    Returns the same six results as _simulate, as (n_skus, n_periods) arrays.
+    """
+    n_skus, n_periods = forecast.shape
+
+    order_q = np.zeros((n_skus, n_periods), dtype=forecast.dtype)
+    on_hand = np.zeros((n_skus, n_periods), dtype=forecast.dtype)
+    ss_target = np.zeros((n_skus, n_periods), dtype=forecast.dtype)
+    below_ss = np.zeros((n_skus, n_periods), dtype=np.int8)
+    stockout = np.zeros((n_skus, n_periods), dtype=np.int8)
+    ending_inv = np.zeros((n_skus, n_periods), dtype=forecast.dtype)
+
+    # SKUs are independent, so each one runs its own state machine
+    for s in prange(n_skus):
+        results = _simulate(
+            forecast[s],
+            demand[s],
+            error[s],
+            last_actual[s],
+            lead_time,
+            review_period,
+            base_ss[s],
+            initial_inv[s],
+            use_rolling_ss,
+            rolling_window,
+            safety_factor,
+            time_factor,
+        )
+        order_q[s] = results[0]
+        on_hand[s] = results[1]
+        ss_target[s] = results[2]
+        below_ss[s] = results[3]
+        stockout[s] = results[4]
+        ending_inv[s] = results[5]
+
+    return order_q, on_hand, ss_target, below_ss, stockout, ending_inv
+
+
+def _check_float_dtype(dtype):
+    """Normalizes dtype, which must be float64 or float32 to match the compiled kernels."""
+    dtype = np.dtype(dtype)
+    if dtype not in (np.float64, np.float32):
+        raise ValueError("dtype must be np.float64 or np.float32")
+    return dtype
+
+
+def _initial_state(forecast_2d, demand_2d, error_2d):
+    """
+    Per-SKU setup shared by the single and batch simulations, on (n_skus, n_periods) arrays.
+
+    Returns the position of the last actual demand (-1 if every period is a
+    projection), the int8 projection flags and the std of the historical
+    forecast errors used for the initial safety stock.
+    """
+    n_skus, n_periods = forecast_2d.shape
+
+    # Identify where actual demand ends for every SKU (-1 if all projections)
+    valid_demand = ~np.isnan(demand_2d)
+    if n_periods:
+        last_actual = np.where(
+            valid_demand.any(axis=1),
+            n_periods - 1 - np.argmax(valid_demand[:, ::-1], axis=1),
+            -1,
+        )
+    else:
+        # No periods at all; argmax cannot reduce over an empty axis
+        last_actual = np.full(n_skus, -1, dtype=np.int64)
+
+    # Mark projection periods
+    is_projection = (np.arange(n_periods) > last_actual[:, None]).astype(np.int8)
+
+    # Calculate initial safety stock based on each SKU's historical errors (if any)
+    historical_errors = np.where(is_projection == 0, error_2d, np.nan)
+    has_history = ~np.isnan(historical_errors).all(axis=1)
+    std_error_all = np.zeros(n_skus)
+    if has_history.any():
+        std_error_all[has_history] = np.nanstd(historical_errors[has_history], axis=1)
+
+    # If no historical data, use a fraction of average forecast as proxy
+    if not has_history.all():
+        avg_forecast = np.nanmean(forecast_2d[~has_history], axis=1)
+        std_error_all[~has_history] = np.where(avg_forecast > 0, 0.2 * avg_forecast, 0)
+
+    return last_actual, is_projection, std_error_all
 
 
 def forecast_periodic_review_inventory(
@@ -12,6 +268,7 @@ def forecast_periodic_review_inventory(
     rolling_window=None,
     include_review_period_in_ss=True,
     plot=False,
+    dtype=np.float64,
 ):
     """
     Simulates a forecast-driven periodic review inventory control system with explicit safety stock tracking.
@@ -51,10 +308,14 @@ def forecast_periodic_review_inventory(
     plot : bool, default False
         If True, shows two plots: inventory levels and demand vs forecast.
 
+    dtype : {np.float64, np.float32}, default np.float64
+        Floating point type of the simulation arrays. np.float32 halves memory traffic
+        on long horizons at the cost of precision in the float result columns.
+
     Returns
     -------
     pandas.DataFrame
-        The input DataFrame with additional columns:
+        DataFrame with the input 'period', 'demand' and 'forecast' columns and:
         - 'order_quantity': order placed at each review point
         - 'on_hand_inventory': total inventory on hand before demand
         - 'safety_stock_target': calculated safety stock requirement
@@ -65,40 +326,24 @@ def forecast_periodic_review_inventory(
         - 'is_projection': 1 for periods without actual demand data
     """
 
-    df = df.copy()
-    n_periods = len(df)
-
-    # Initialize columns
-    df["order_quantity"] = 0.0
-    df["on_hand_inventory"] = 0.0
-    df["safety_stock_target"] = 0.0
-    df["below_safety_stock"] = 0
-    df["stockout"] = 0
-    df["ending_inventory"] = 0.0
-    df["error"] = np.nan
-    df["is_projection"] = 0
-
-    # Identify where actual demand ends and projections begin
-    last_actual_period = df["demand"].last_valid_index()
-    if last_actual_period is None:
-        last_actual_period = -1  # All periods are projections
-
-    # Calculate error only where we have actual demand
-    df.loc[:last_actual_period, "error"] = (
-        df.loc[:last_actual_period, "forecast"] - df.loc[:last_actual_period, "demand"]
-    )
+    dtype = _check_float_dtype(dtype)
 
-    # Mark projection periods
-    df.loc[last_actual_period + 1 :, "is_projection"] = 1
+    # Read inputs into plain arrays so the setup and loop avoid pandas indexing
+    period_arr = df["period"].to_numpy()
+    forecast_arr = df["forecast"].to_numpy(dtype=dtype)
+    demand_arr = df["demand"].to_numpy(dtype=dtype)
 
-    # Calculate initial safety stock based on historical errors (if any)
-    historical_errors = df["error"].dropna()
-    if len(historical_errors) > 0:
-        std_error_all = np.std(historical_errors)
-    else:
-        # If no historical data, use a fraction of average forecast as proxy
-        avg_forecast = df["forecast"].mean()
-        std_error_all = 0.2 * avg_forecast if avg_forecast > 0 else 0
+    # Forecast error; NaN wherever actual demand is missing, including projections
+    error = forecast_arr - demand_arr
+
+    # Projection start, projection flags and historical error std, computed as a
+    # single-SKU batch so results match forecast_periodic_review_inventory_batch
+    last_actual, is_projection, std_error_all = _initial_state(
+        forecast_arr[None, :], demand_arr[None, :], error[None, :]
+    )
+    last_actual_period = int(last_actual[0])
+    is_projection = is_projection[0]
+    std_error_all = std_error_all[0]
 
     # Calculate safety stock with optional review period inclusion
     if include_review_period_in_ss:
@@ -111,90 +356,59 @@ def forecast_periodic_review_inventory(
     if rolling_window is None:
         rolling_window = 2 * review_period
 
-    # Initialize tracking variables
-    df["safety_stock_target"] = base_safety_stock
-    current_ss_target = base_safety_stock
-    on_hand_inventory = initial_inventory
-    in_transit_orders = [0.0] * lead_time
-
-    for t in range(n_periods):
-        # Update safety stock target if rolling option is enabled (only for historical periods)
-        if (
-            use_rolling_ss
-            and t >= rolling_window
-            and t % rolling_window == 0
-            and t <= last_actual_period
-        ):
-            recent_errors = df["error"].iloc[max(0, t - rolling_window) : t]
-            recent_errors = recent_errors.dropna()
-            if len(recent_errors) > 0:
-                std_error_rolling = np.std(recent_errors)
-                current_ss_target = safety_factor * std_error_rolling * time_factor
-                df.loc[t:, "safety_stock_target"] = current_ss_target
-
-        # Receive any arriving order
-        arriving_order = in_transit_orders.pop(0)
-        on_hand_inventory += arriving_order
-
-        # Record inventory before demand
-        df.loc[t, "on_hand_inventory"] = on_hand_inventory
-
-        # Place order if at review period
-        if t % review_period == 0:
-            # Calculate inventory position (on-hand + in-transit)
-            inventory_position = on_hand_inventory + sum(in_transit_orders)
-
-            # Calculate expected demand during lead time + review period
-            future_periods = min(lead_time + review_period, n_periods - t)
-            future_demand = df["forecast"].iloc[t : t + future_periods].sum()
-
-            # Calculate order-up-to level (expected demand + safety stock)
-            order_up_to_level = future_demand + current_ss_target
-
-            # Place order to reach target level
-            order_qty = max(0, order_up_to_level - inventory_position)
-            df.loc[t, "order_quantity"] = order_qty
-            in_transit_orders.append(order_qty)
-        else:
-            in_transit_orders.append(0.0)
-
-        # Use actual demand if available, otherwise use forecast for projections
-        if t <= last_actual_period:
-            demand = df.loc[t, "demand"]
-        else:
-            demand = df.loc[t, "forecast"]
-
-        # Fulfill demand
-        if demand <= on_hand_inventory:
-            on_hand_inventory -= demand
-            stockout = 0
-        else:
-            # Stockout occurs
-            on_hand_inventory = 0
-            stockout = 1
-
-        # Check if we're below safety stock target
-        below_ss = 1 if on_hand_inventory < current_ss_target else 0
+    # Run the period-by-period simulation in compiled code
+    order_q, on_hand, ss_target, below_ss, stockout, ending_inv = _simulate(
+        forecast_arr,
+        demand_arr,
+        error,
+        last_actual_period,
+        int(lead_time),
+        int(review_period),
+        float(base_safety_stock),
+        float(initial_inventory),
+        bool(use_rolling_ss),
+        int(rolling_window),
+        float(safety_factor),
+        float(time_factor),
+    )
 
-        # Record results
-        df.loc[t, "ending_inventory"] = on_hand_inventory
-        df.loc[t, "stockout"] = stockout
-        df.loc[t, "below_safety_stock"] = below_ss
+    # Build the result in one go rather than copying the input and adding columns
+    result = pd.DataFrame(
+        {
+            "period": period_arr,
+            "demand": df["demand"].to_numpy(),
+            "forecast": df["forecast"].to_numpy(),
+            "order_quantity": order_q,
+            "on_hand_inventory": on_hand,
+            "safety_stock_target": ss_target,
+            "below_safety_stock": below_ss,
+            "stockout": stockout,
+            "ending_inventory": ending_inv,
+            "error": error,
+            "is_projection": is_projection,
+        },
+        index=df.index,
+    )
 
     # Plotting
     if plot:
-        periods = df["period"]
+        # Work on NumPy arrays so masking does not build new Series
+        periods = period_arr
         fig, axs = plt.subplots(2, 1, figsize=(12, 10), sharex=True)
 
         # Plot 1: Inventory levels
         # Split historical and projected data
-        hist_mask = df["is_projection"] == 0
-        proj_mask = df["is_projection"] == 1
+        proj_mask = is_projection.astype(bool)
+        hist_mask = ~proj_mask
+        hist_periods = periods[hist_mask]
+        proj_periods = periods[proj_mask]
+        hist_ending = ending_inv[hist_mask]
+        proj_ending = ending_inv[proj_mask]
 
         # Historical inventory
         axs[0].plot(
-            periods[hist_mask],
-            df.loc[hist_mask, "ending_inventory"],
+            hist_periods,
+            hist_ending,
             label="Ending Inventory (Actual)",
             marker="o",
             color="blue",
@@ -204,14 +418,8 @@ def forecast_periodic_review_inventory(
         if proj_mask.any():
             # Connect the last historical point to first projection
             if hist_mask.any():
-                bridge_periods = [
-                    periods[hist_mask].iloc[-1],
-                    periods[proj_mask].iloc[0],
-                ]
-                bridge_values = [
-                    df.loc[hist_mask, "ending_inventory"].iloc[-1],
-                    df.loc[proj_mask, "ending_inventory"].iloc[0],
-                ]
+                bridge_periods = [hist_periods[-1], proj_periods[0]]
+                bridge_values = [hist_ending[-1], proj_ending[0]]
                 axs[0].plot(
                     bridge_periods,
                     bridge_values,
@@ -221,8 +429,8 @@ def forecast_periodic_review_inventory(
                 )
 
             axs[0].plot(
-                periods[proj_mask],
-                df.loc[proj_mask, "ending_inventory"],
+                proj_periods,
+                proj_ending,
                 label="Ending Inventory (Projected)",
                 marker="o",
                 linestyle="--",
@@ -232,7 +440,7 @@ def forecast_periodic_review_inventory(
         # Safety stock target
         axs[0].plot(
             periods,
-            df["safety_stock_target"],
+            ss_target,
             label="Safety Stock Target",
             linestyle="--",
             color="red",
@@ -241,18 +449,18 @@ def forecast_periodic_review_inventory(
         axs[0].fill_between(
             periods,
             0,
-            df["safety_stock_target"],
+            ss_target,
             alpha=0.2,
             color="red",
             label="Safety Stock Zone",
         )
 
         # Mark stockouts
-        stockout_mask = df["stockout"] == 1
+        stockout_mask = stockout.astype(bool)
         if stockout_mask.any():
             axs[0].scatter(
                 periods[stockout_mask & hist_mask],
-                df.loc[stockout_mask & hist_mask, "ending_inventory"],
+                ending_inv[stockout_mask & hist_mask],
                 color="black",
                 s=100,
                 marker="x",
@@ -261,7 +469,7 @@ def forecast_periodic_review_inventory(
             )
             axs[0].scatter(
                 periods[stockout_mask & proj_mask],
-                df.loc[stockout_mask & proj_mask, "ending_inventory"],
+                ending_inv[stockout_mask & proj_mask],
                 color="gray",
                 s=100,
                 marker="x",
@@ -286,15 +494,15 @@ def forecast_periodic_review_inventory(
 
         # Plot 2: Demand vs Forecast
         axs[1].plot(
-            periods[hist_mask],
-            df.loc[hist_mask, "demand"],
+            hist_periods,
+            demand_arr[hist_mask],
             label="Actual Demand",
             marker="x",
             color="green",
         )
         axs[1].plot(
             periods,
-            df["forecast"],
+            forecast_arr,
             label="Forecast",
             linestyle="--",
             marker="s",
@@ -320,4 +528,127 @@ def forecast_periodic_review_inventory(
         plt.tight_layout()
         plt.show()
 
-    return df
+    return result
+
+
+def forecast_periodic_review_inventory_batch(
+    df,
+    lead_time,
+    review_period,
+    safety_factor,
+    initial_inventory,
+    use_rolling_ss=False,
+    rolling_window=None,
+    include_review_period_in_ss=True,
+    sku_column="sku",
+    dtype=np.float64,
+):
+    """
+    Runs forecast_periodic_review_inventory for many SKUs at once, simulating the SKUs in parallel.
+    Every SKU must cover the same periods.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Long-form input data with columns:
+        - sku_column: SKU identifier
+        - 'period': time period index
+        - 'demand': actual demand (can be NaN for future periods)
+        - 'forecast': forecasted demand (can extend beyond actual demand)
+
+    lead_time, review_period, safety_factor, use_rolling_ss, rolling_window, include_review_period_in_ss, dtype
+        Same as in forecast_periodic_review_inventory, shared by all SKUs.
+
+    initial_inventory : float, pandas.Series or array-like
+        Initial total inventory level, either shared by all SKUs or one value per SKU.
+        A Series is aligned on its SKU index; other array-likes follow sorted SKU order.
+
+    sku_column : str, default "sku"
+        Name of the column identifying the SKU.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Long-form DataFrame sorted by SKU and period, with the sku_column, 'period', 'demand'
+        and 'forecast' columns plus the result columns of forecast_periodic_review_inventory.
+    """
+
+    dtype = _check_float_dtype(dtype)
+    if df[sku_column].isna().any():
+        raise ValueError(f"Column '{sku_column}' contains missing SKU values")
+    df = df.sort_values([sku_column, "period"], kind="stable")
+    sku_sizes = df.groupby(sku_column, sort=True).size()
+    if sku_sizes.nunique() > 1:
+        raise ValueError("Every SKU must have the same number of periods")
+    n_skus = len(sku_sizes)
+    n_periods = int(sku_sizes.iloc[0]) if n_skus else 0
+
+    # Lay the inputs out as (n_skus, n_periods) arrays, one row per SKU
+    period_2d = df["period"].to_numpy().reshape(n_skus, n_periods)
+    if not (period_2d == period_2d[:1]).all():
+        raise ValueError("Every SKU must cover the same periods")
+    forecast_2d = df["forecast"].to_numpy(dtype=dtype).reshape(n_skus, n_periods)
+    demand_2d = df["demand"].to_numpy(dtype=dtype).reshape(n_skus, n_periods)
+
+    # Forecast error; NaN wherever actual demand is missing, including projections
+    error_2d = forecast_2d - demand_2d
+
+    # Calculate safety stock with optional review period inclusion
+    if include_review_period_in_ss:
+        time_factor = np.sqrt(lead_time + review_period)
+    else:
+        time_factor = np.sqrt(lead_time)
+
+    # Per-SKU projection start, projection flags and historical error std
+    last_actual, is_projection, std_error_all = _initial_state(
+        forecast_2d, demand_2d, error_2d
+    )
+
+    base_safety_stock = safety_factor * std_error_all * time_factor
+
+    # Align per-SKU initial inventory by SKU label, not by position
+    if isinstance(initial_inventory, pd.Series):
+        initial_inventory = initial_inventory.reindex(sku_sizes.index)
+        if initial_inventory.isna().any():
+            raise ValueError("initial_inventory has no value for some SKUs")
+    initial_inv = np.asarray(initial_inventory, dtype=np.float64).ravel()
+    if initial_inv.size not in (1, n_skus):
+        raise ValueError("initial_inventory must be a single value or one value per SKU")
+    initial_inv = np.broadcast_to(initial_inv, (n_skus,)).copy()
+
+    if rolling_window is None:
+        rolling_window = 2 * review_period
+
+    # Run the period-by-period simulations in compiled code, one SKU per thread
+    order_q, on_hand, ss_target, below_ss, stockout, ending_inv = _simulate_batch(
+        forecast_2d,
+        demand_2d,
+        error_2d,
+        last_actual,
+        int(lead_time),
+        int(review_period),
+        base_safety_stock,
+        initial_inv,
+        bool(use_rolling_ss),
+        int(rolling_window),
+        float(safety_factor),
+        float(time_factor),
+    )
+
+    return pd.DataFrame(
+        {
+            sku_column: df[sku_column].to_numpy(),
+            "period": df["period"].to_numpy(),
+            "demand": df["demand"].to_numpy(),
+            "forecast": df["forecast"].to_numpy(),
+            "order_quantity": order_q.ravel(),
+            "on_hand_inventory": on_hand.ravel(),
+            "safety_stock_target": ss_target.ravel(),
+            "below_safety_stock": below_ss.ravel(),
+            "stockout": stockout.ravel(),
+            "ending_inventory": ending_inv.ravel(),
+            "error": error_2d.ravel(),
+            "is_projection": is_projection.ravel(),
+        },
+        index=df.index,
+    )
@@ -0,0 +1,231 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+from utils import (
+    _check_float_dtype,
+    forecast_periodic_review_inventory,
+    forecast_periodic_review_inventory_batch,
+)
+
+SAMPLE_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "data", "raw", "sample_future_forecasts.csv"
+)
+
+
+def load_sample_with_missing_forecast():
+    df = pd.read_csv(SAMPLE_PATH)
+    df.loc[10, "forecast"] = np.nan
+    return df
+
+
+def test_missing_forecast_does_not_stop_ordering():
+    result = forecast_periodic_review_inventory(
+        load_sample_with_missing_forecast(),
+        lead_time=2,
+        review_period=3,
+        safety_factor=1.645,
+        initial_inventory=0,
+    )
+
+    assert (result["order_quantity"].iloc[11:] > 0).any()
+    assert result["stockout"].sum() == 3
+
+
+def test_review_order_skips_missing_forecast_in_window():
+    df = load_sample_with_missing_forecast()
+    result = forecast_periodic_review_inventory(
+        df,
+        lead_time=2,
+        review_period=3,
+        safety_factor=1.645,
+        initial_inventory=0,
+    )
+
+    # At t=9 nothing is in transit and the window t..t+lead_time+review_period
+    # covers the missing forecast at t=10, which the baseline skipped
+    t = 9
+    future_demand = df["forecast"].iloc[t : t + 5].sum()
+    expected_order = max(
+        0.0,
+        future_demand
+        + result["safety_stock_target"].iloc[t]
+        - result["on_hand_inventory"].iloc[t],
+    )
+    assert np.isclose(result["order_quantity"].iloc[t], expected_order)
+
+
+def make_multi_sku_sample():
+    base = pd.read_csv(SAMPLE_PATH)
+    skus = []
+    for scale in (0.8, 1.0, 1.2):
+        sku = base.copy()
+        sku["demand"] = sku["demand"] * scale
+        skus.append(sku)
+    # One SKU with no demand history and one with a shorter history
+    skus[0]["demand"] = np.nan
+    skus[2].loc[40:, "demand"] = np.nan
+    for i, sku in enumerate(skus):
+        sku["sku"] = f"S{i}"
+    return skus
+
+
+def test_batch_matches_single_sku_runs():
+    skus = make_multi_sku_sample()
+    long_df = pd.concat(skus, ignore_index=True).sample(frac=1, random_state=0)
+
+    result = forecast_periodic_review_inventory_batch(
+        long_df,
+        lead_time=2,
+        review_period=3,
+        safety_factor=1.645,
+        initial_inventory=0,
+        use_rolling_ss=True,
+    )
+
+    for sku, sku_result in result.groupby("sku"):
+        expected = forecast_periodic_review_inventory(
+            skus[int(sku[1:])][["period", "demand", "forecast"]],
+            lead_time=2,
+            review_period=3,
+            safety_factor=1.645,
+            initial_inventory=0,
+            use_rolling_ss=True,
+        )
+        for column in expected.columns:
+            np.testing.assert_allclose(
+                sku_result[column].to_numpy(dtype=float),
+                expected[column].to_numpy(dtype=float),
+                rtol=1e-9,
+            )
+
+
+def test_batch_aligns_initial_inventory_series_by_sku():
+    long_df = pd.concat(make_multi_sku_sample(), ignore_index=True)
+    initial_inventory = pd.Series({"S2": 30000.0, "S0": 10000.0, "S1": 20000.0})
+
+    result = forecast_periodic_review_inventory_batch(
+        long_df,
+        lead_time=2,
+        review_period=3,
+        safety_factor=1.645,
+        initial_inventory=initial_inventory,
+    )
+
+    first_periods = result.groupby("sku")["on_hand_inventory"].first()
+    assert first_periods.to_dict() == initial_inventory.to_dict()
+
+
+def test_batch_rejects_initial_inventory_of_wrong_length():
+    long_df = pd.concat(make_multi_sku_sample(), ignore_index=True)
+
+    with pytest.raises(ValueError):
+        forecast_periodic_review_inventory_batch(
+            long_df,
+            lead_time=2,
+            review_period=3,
+            safety_factor=1.645,
+            initial_inventory=[0.0, 0.0],
+        )
+
+
+def test_batch_returns_empty_frame_for_empty_input():
+    long_df = pd.concat(make_multi_sku_sample(), ignore_index=True).iloc[:0]
+
+    result = forecast_periodic_review_inventory_batch(
+        long_df,
+        lead_time=1,
+        review_period=3,
+        safety_factor=1.645,
+        initial_inventory=0,
+    )
+
+    assert result.empty
+    assert "order_quantity" in result.columns
+
+
+def test_batch_rejects_missing_sku_values():
+    long_df = pd.concat(make_multi_sku_sample(), ignore_index=True)
+    long_df.loc[5, "sku"] = np.nan
+
+    with pytest.raises(ValueError, match="missing SKU"):
+        forecast_periodic_review_inventory_batch(
+            long_df,
+            lead_time=1,
+            review_period=3,
+            safety_factor=1.645,
+            initial_inventory=0,
+        )
+
+
+FLOAT_RESULT_COLUMNS = [
+    "order_quantity",
+    "on_hand_inventory",
+    "safety_stock_target",
+    "ending_inventory",
+    "error",
+]
+
+
+def assert_float32_close_to_float64(result_32, result_64):
+    for column in FLOAT_RESULT_COLUMNS:
+        assert result_32[column].dtype == np.float32
+        np.testing.assert_allclose(
+            result_32[column].to_numpy(dtype=float),
+            result_64[column].to_numpy(dtype=float),
+            rtol=1e-6,
+            atol=0.05,
+        )
+    np.testing.assert_array_equal(result_32["stockout"], result_64["stockout"])
+
+
+def test_float32_matches_float64():
+    df = pd.read_csv(SAMPLE_PATH)
+    kwargs = dict(
+        lead_time=2,
+        review_period=3,
+        safety_factor=1.645,
+        initial_inventory=0,
+        use_rolling_ss=True,
+    )
+
+    result_64 = forecast_periodic_review_inventory(df, **kwargs)
+    result_32 = forecast_periodic_review_inventory(df, dtype=np.float32, **kwargs)
+
+    assert_float32_close_to_float64(result_32, result_64)
+
+
+def test_batch_float32_matches_float64():
+    long_df = pd.concat(make_multi_sku_sample(), ignore_index=True)
+    kwargs = dict(
+        lead_time=2,
+        review_period=3,
+        safety_factor=1.645,
+        initial_inventory=0,
+        use_rolling_ss=True,
+    )
+
+    result_64 = forecast_periodic_review_inventory_batch(long_df, **kwargs)
+    result_32 = forecast_periodic_review_inventory_batch(
+        long_df, dtype=np.float32, **kwargs
+    )
+
+    assert_float32_close_to_float64(result_32, result_64)
+
+
+def test_unsupported_dtype_raises():
+    with pytest.raises(ValueError):
+        _check_float_dtype(np.int64)
+    with pytest.raises(ValueError):
+        forecast_periodic_review_inventory(
+            pd.read_csv(SAMPLE_PATH),
+            lead_time=1,
+            review_period=3,
+            safety_factor=1.645,
+            initial_inventory=0,
+            dtype=np.int64,
+        )